@@ -1,20 +1,34 @@
 from langgraph.prebuilt import create_react_agent
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.tools import tool
-import json
+from common.tool_loader import load_tool_specs
+from common.http import session as http_session
+from common.jsonio import dumps as _dumps, parse_lenient_json as _parse_lenient_json
+import asyncio
+import functools
+import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List
-import requests
 import time
 import re
 
+logger = logging.getLogger(__name__)
+
+# Compiled once at import - extract_recipients_from_query runs on every
+# request, so the patterns shouldn't be rebuilt per call
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_CHANNEL_ID_RE = re.compile(r'#?([C][A-Z0-9]{8,})')
+_CHANNEL_NAME_RE = re.compile(r'#([a-zA-Z0-9_-]+)')
+_THREAD_RE = re.compile(r'thread[:\s]+([0-9]+\.?[0-9]*)', re.IGNORECASE)
+
 def create_comms_workflow_tools():
     """Create tools for communications workflow: Plan → Route → Send → Report"""
     
     @tool
     def plan_message_routing(user_query: str) -> str:
         """PHASE 1: Plan message routing based on recipients mentioned (LLM intervention)"""
-        return json.dumps({
+        return _dumps({
             "query": user_query,
             "status": "planned",
             "next_phase": "route_and_send"
@@ -24,23 +38,22 @@ def create_comms_workflow_tools():
     def route_and_send_messages(routing_plan_json: str) -> str:
         """PHASE 2: Route and send messages to all recipients (NO LLM intervention)"""
         try:
-            print("📬 PHASE 2: Routing and sending messages...")
+            logger.debug("📬 PHASE 2: Routing and sending messages...")
             
             # Parse routing plan from the planning phase
-            routing_plan = json.loads(routing_plan_json)
+            routing_plan = _parse_lenient_json(routing_plan_json)
             
             # Load available comms tools
             try:
-                with open("agents/comms/tools.json", 'r') as f:
-                    comms_tools_config = json.load(f)
-                    
-                print("🔧 Available comms tools loaded:")
+                comms_tools_config = load_tool_specs("agents/comms/tools.json")
+
+                logger.debug("🔧 Available comms tools loaded:")
                 for tool in comms_tools_config:
-                    print(f"  - {tool['name']}: {tool.get('description', 'No description')}")
+                    logger.debug("  - %s: %s", tool['name'], tool.get('description', 'No description'))
                     
             except Exception as e:
-                print(f"❌ Could not load tools.json: {e}")
-                return json.dumps({"error": "Could not load comms tools", "status": "error"})
+                logger.error("❌ Could not load tools.json: %s", e)
+                return _dumps({"error": "Could not load comms tools", "status": "error"})
             
             # Extract routing information from plan
             file_url = routing_plan.get('fileUrl', '')
@@ -49,20 +62,20 @@ def create_comms_workflow_tools():
             email_recipients = routing_plan.get('email_recipients', [])
             
             if not file_url:
-                return json.dumps({
+                return _dumps({
                     "error": "No file URL provided for sending",
                     "status": "error"
                 })
             
-            print(f"📄 File URL: {file_url}")
-            print(f"📱 Slack channels: {len(slack_channels)}")
-            print(f"📧 Email recipients: {len(email_recipients)}")
+            logger.debug("📄 File URL: %s", file_url)
+            logger.debug("📱 Slack channels: %s", len(slack_channels))
+            logger.debug("📧 Email recipients: %s", len(email_recipients))
             
             execution_log = []
             
             # Send to Slack channels (consolidate into single API call)
             if slack_channels:
-                print(f"📱 Sending to {len(slack_channels)} Slack channels...")
+                logger.debug("📱 Sending to %s Slack channels...", len(slack_channels))
                 start_time = time.time()
                 
                 try:
@@ -91,7 +104,7 @@ def create_comms_workflow_tools():
                         })
                         
                 except Exception as e:
-                    print(f"❌ Slack send failed: {e}")
+                    logger.error("❌ Slack send failed: %s", e)
                     execution_log.append({
                         "type": "slack",
                         "channels": slack_channels,
@@ -104,46 +117,58 @@ def create_comms_workflow_tools():
                 # Split into batches of 10 for better API management
                 batch_size = 10
                 total_batches = (len(email_recipients) + batch_size - 1) // batch_size
-                
-                for batch_num in range(total_batches):
+
+                # Find Email tool config once - it is the same for every batch
+                email_tool_config = next(
+                    (tool for tool in comms_tools_config if tool['name'] == 'send_email_message'),
+                    None
+                )
+
+                def send_email_batch(batch_num):
+                    """Send one batch of recipients; returns a log entry"""
                     start_idx = batch_num * batch_size
                     end_idx = min(start_idx + batch_size, len(email_recipients))
                     batch_recipients = email_recipients[start_idx:end_idx]
-                    
-                    print(f"📧 Sending to email batch {batch_num + 1}/{total_batches}: {len(batch_recipients)} recipients")
+
+                    logger.debug("📧 Sending to email batch %s/%s: %s recipients", batch_num + 1, total_batches, len(batch_recipients))
                     start_time = time.time()
-                    
+
                     try:
-                        # Find Email tool config
-                        email_tool_config = next(
-                            (tool for tool in comms_tools_config if tool['name'] == 'send_email_message'),
-                            None
-                        )
-                        
                         if email_tool_config:
-                            api_response = execute_comms_api_call(email_tool_config, {
+                            execute_comms_api_call(email_tool_config, {
                                 'fileUrl': file_url,
                                 'recipients': batch_recipients
                             })
-                            
+
                             execution_time = time.time() - start_time
-                            execution_log.append({
+                            return {
                                 "type": "email",
                                 "batch": batch_num + 1,
                                 "recipients_count": len(batch_recipients),
                                 "execution_time": f"{execution_time:.2f}s",
                                 "status": "success"
-                            })
-                            
+                            }
+                        return None
+
                     except Exception as e:
-                        print(f"❌ Email send failed for batch {batch_num + 1}: {e}")
-                        execution_log.append({
+                        logger.error("❌ Email send failed for batch %s: %s", batch_num + 1, e)
+                        return {
                             "type": "email",
                             "batch": batch_num + 1,
                             "recipients_count": len(batch_recipients),
                             "error": str(e),
                             "status": "failed"
-                        })
+                        }
+
+                # Batches are independent - send them concurrently so total
+                # time is max(batch) instead of sum(batch)
+                if total_batches > 1:
+                    with ThreadPoolExecutor(max_workers=min(8, total_batches)) as pool:
+                        batch_logs = list(pool.map(send_email_batch, range(total_batches)))
+                else:
+                    batch_logs = [send_email_batch(0)]
+
+                execution_log.extend(log for log in batch_logs if log is not None)
             
             # Summary
             total_slack = len(slack_channels)
@@ -151,11 +176,11 @@ def create_comms_workflow_tools():
             successful_slack = len([log for log in execution_log if log.get("type") == "slack" and log.get("status") == "success"])
             successful_email_recipients = sum(log.get('recipients_count', 0) for log in execution_log if log.get('type') == 'email' and log.get('status') == 'success')
             
-            print(f"✅ Message routing complete!")
-            print(f"📱 Slack: {successful_slack} calls for {total_slack} channels")
-            print(f"📧 Email: {successful_email_recipients}/{total_emails} recipients")
+            logger.info("✅ Message routing complete!")
+            logger.debug("📱 Slack: %s calls for %s channels", successful_slack, total_slack)
+            logger.debug("📧 Email: %s/%s recipients", successful_email_recipients, total_emails)
             
-            return json.dumps({
+            return _dumps({
                 "total_slack_channels": total_slack,
                 "successful_slack_calls": successful_slack,
                 "total_email_recipients": total_emails,
@@ -165,7 +190,7 @@ def create_comms_workflow_tools():
             })
             
         except Exception as e:
-            return json.dumps({"error": str(e), "status": "error"})
+            return _dumps({"error": str(e), "status": "error"})
     
     return [plan_message_routing, route_and_send_messages]
 
@@ -178,7 +203,7 @@ def execute_comms_api_call(tool_config: Dict, params: Dict) -> Dict:
     headers = execution_info.get('headers', {})
     timeout = execution_info.get('timeout', 30)
     
-    print(f"🌐 Making {method} request to {url}")
+    logger.debug("🌐 Making %s request to %s", method, url)
     
     try:
         # Handle POST request with JSON body
@@ -189,21 +214,21 @@ def execute_comms_api_call(tool_config: Dict, params: Dict) -> Dict:
                 body_key = body_map.get(param_name, param_name)
                 request_body[body_key] = param_value
         
-        print(f"📋 Request body keys: {list(request_body.keys())}")
+        logger.debug("📋 Request body keys: %s", list(request_body.keys()))
         
         # Log request details safely
         if 'slack' in url:
             channels = request_body.get('channels', [])
             channel_id = request_body.get('channelId', '')
-            print(f"📱 Slack: channelId={channel_id}, channels={len(channels)}, threadId={request_body.get('threadId', 'none')}")
+            logger.debug("📱 Slack: channelId=%s, channels=%s, threadId=%s", channel_id, len(channels), request_body.get('threadId', 'none'))
         elif 'email' in url:
             recipients = request_body.get('recipients', [])
-            print(f"📧 Email: {len(recipients)} recipients")
+            logger.debug("📧 Email: %s recipients", len(recipients))
         
-        response = requests.post(url, json=request_body, headers=headers, timeout=timeout)
+        response = http_session.post(url, json=request_body, headers=headers, timeout=timeout)
         
         response.raise_for_status()
-        print(f"✅ API call successful: {response.status_code}")
+        logger.info("✅ API call successful: %s", response.status_code)
         
         try:
             return response.json()
@@ -211,27 +236,23 @@ def execute_comms_api_call(tool_config: Dict, params: Dict) -> Dict:
             return {"response_text": response.text, "status_code": response.status_code}
             
     except Exception as e:
-        print(f"❌ API call failed: {str(e)}")
+        logger.error("❌ API call failed: %s", str(e))
         raise Exception(f"Comms API call failed: {str(e)}")
 
 def extract_recipients_from_query(user_query: str) -> Dict:
     """Extract email addresses and channel mentions from user query"""
     
     # Extract email addresses
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    emails = re.findall(email_pattern, user_query)
-    
+    emails = _EMAIL_RE.findall(user_query)
+
     # Extract Slack channel IDs (format: C followed by alphanumeric)
-    channel_pattern = r'#?([C][A-Z0-9]{8,})'
-    channels = re.findall(channel_pattern, user_query)
-    
+    channels = _CHANNEL_ID_RE.findall(user_query)
+
     # Extract Slack channel names (format: #channelname)
-    channel_name_pattern = r'#([a-zA-Z0-9_-]+)'
-    channel_names = re.findall(channel_name_pattern, user_query)
-    
+    channel_names = _CHANNEL_NAME_RE.findall(user_query)
+
     # Extract thread ID
-    thread_pattern = r'thread[:\s]+([0-9]+\.?[0-9]*)'
-    threads = re.findall(thread_pattern, user_query, re.IGNORECASE)
+    threads = _THREAD_RE.findall(user_query)
     
     return {
         "emails": emails,
@@ -240,13 +261,13 @@ def extract_recipients_from_query(user_query: str) -> Dict:
         "thread_ids": threads
     }
 
+@functools.lru_cache(maxsize=1)
 def build_comms_system_prompt() -> str:
     """Build system prompt for communications agent"""
     
     try:
         # Load tools to create dynamic prompt
-        with open("agents/comms/tools.json", 'r') as f:
-            tools_config = json.load(f)
+        tools_config = load_tool_specs("agents/comms/tools.json")
         
         # Create tool descriptions
         tool_descriptions = []
@@ -258,7 +279,7 @@ def build_comms_system_prompt() -> str:
         tools_text = "\n".join(tool_descriptions)
         
     except Exception as e:
-        print(f"⚠️ Could not load tools for dynamic prompt: {e}")
+        logger.warning("⚠️ Could not load tools for dynamic prompt: %s", e)
         tools_text = "- send_slack_message: Send messages to Slack channels\n- send_email_message: Send messages via email"
     
     return f"""You are a communications agent that sends messages via Slack and Email using a 2-phase workflow:
@@ -327,7 +348,13 @@ def build_comms_agent():
     workflow_tools = create_comms_workflow_tools()
     
     # Initialize model  
-    model = ChatGoogleGenerativeAI(model="gemini-2.5-flash", temperature=0)
+    # Routing is mechanical - match recipients to two send tools - so the
+    # lite model handles it at a fraction of the latency. Overridable for
+    # rollback without a deploy.
+    model = ChatGoogleGenerativeAI(
+        model=os.getenv("COMMS_MODEL", "gemini-2.5-flash-lite"),
+        temperature=0
+    )
     
     # Build system prompt
     system_prompt = build_comms_system_prompt()
@@ -349,10 +376,11 @@ async def process_message_request(user_input: str) -> Dict[str, Any]:
         # Use the communications agent
         comms_agent = build_comms_agent()
         
-        print(f"📬 Starting message routing for: {user_input[:100]}...")
+        logger.debug("📬 Starting message routing for: %s...", user_input[:100])
         
-        # Let the agent handle the workflow
-        result = comms_agent.invoke({
+        # Run the blocking invocation on a worker thread so the event
+        # loop stays free while the LLM and send API round-trips run
+        result = await asyncio.to_thread(comms_agent.invoke, {
             "messages": [{"role": "user", "content": user_input}]
         })
         
@@ -1,22 +1,28 @@
 from langgraph.prebuilt import create_react_agent
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.tools import tool
-import json
+from common.tool_loader import load_tool_specs
+from common.http import session as http_session
+from common.jsonio import dumps as _dumps, parse_lenient_json as _parse_lenient_json
+import asyncio
+import functools
+import logging
 import os
 from typing import Dict, Any, List
-import requests
 import time
 import re
 
+logger = logging.getLogger(__name__)
+
 def safe_log(message: str, data: Any) -> None:
     """Safely log complex data structures to avoid f-string formatting errors"""
     try:
         if isinstance(data, (dict, list)):
-            print(f"{message}: {json.dumps(data, ensure_ascii=False)}")
+            logger.debug("%s: %s", message, _dumps(data))
         else:
-            print(f"{message}: {data}")
+            logger.debug("%s: %s", message, data)
     except:
-        print(f"{message}: {repr(data)}")
+        logger.debug("%s: %s", message, repr(data))
 
 def create_document_generation_tools():
     """Create tools for document generation workflow: Plan → Parse → Generate → Return"""
@@ -24,7 +30,7 @@ def create_document_generation_tools():
     @tool
     def plan_document_generation(user_query: str) -> str:
         """PHASE 1: Plan document generation based on user request (LLM intervention)"""
-        return json.dumps({
+        return _dumps({
             "query": user_query,
             "status": "planned",
             "next_phase": "parse_and_generate"
@@ -34,16 +40,15 @@ def create_document_generation_tools():
     def parse_and_generate_document(generation_plan_json: str) -> str:
         """PHASE 2: Parse content, select template, and generate document (LLM + API intervention)"""
         try:
-            print("📄 PHASE 2: Parsing content and generating document...")
+            logger.debug("📄 PHASE 2: Parsing content and generating document...")
             
             # Parse the generation plan
-            generation_plan = json.loads(generation_plan_json)
+            generation_plan = _parse_lenient_json(generation_plan_json)
             
             # Load document generation tool config
             try:
-                with open("agents/docs/tools.json", 'r') as f:
-                    tools_config = json.load(f)
-                    
+                tools_config = load_tool_specs("agents/docs/tools.json")
+
                 # Find document generation tool
                 doc_tool_config = None
                 for tool in tools_config:
@@ -52,11 +57,11 @@ def create_document_generation_tools():
                         break
                 
                 if not doc_tool_config:
-                    return json.dumps({"error": "Document generation tool not found", "status": "error"})
+                    return _dumps({"error": "Document generation tool not found", "status": "error"})
                     
             except Exception as e:
-                print(f"❌ Could not load tools.json: {e}")
-                return json.dumps({"error": "Could not load tools config", "status": "error"})
+                logger.error("❌ Could not load tools.json: %s", e)
+                return _dumps({"error": "Could not load tools config", "status": "error"})
             
             # Extract document parameters from plan
             template = generation_plan.get('template', 'template2')  # Default to template2
@@ -66,15 +71,15 @@ def create_document_generation_tools():
             # Build complete document values structure with all required fields
             document_values = build_complete_document_structure(raw_content, template)
             
-            print(f"🔧 Generating document with template: {template}")
-            print(f"📋 Content fields populated: {count_populated_fields(document_values)}")
-            print(f"🔒 Password protection: {password_protection}")
+            logger.debug("🔧 Generating document with template: %s", template)
+            logger.debug("📋 Content fields populated: %s", count_populated_fields(document_values))
+            logger.debug("🔒 Password protection: %s", password_protection)
             
             # Safe logging of document structure
-            print(f"📊 Document structure keys: {len(document_values)} fields")
+            logger.debug("📊 Document structure keys: %s fields", len(document_values))
             table0_items = document_values.get('table0Items', [])
             table1_items = document_values.get('table1Items', [])
-            print(f"📊 Table0 items: {len(table0_items)}, Table1 items: {len(table1_items)}")
+            logger.debug("📊 Table0 items: %s, Table1 items: %s", len(table0_items), len(table1_items))
             
             start_time = time.time()
             
@@ -88,9 +93,9 @@ def create_document_generation_tools():
                 
                 execution_time = time.time() - start_time
                 
-                print(f"✅ Document generated successfully in {execution_time:.2f}s")
+                logger.info("✅ Document generated successfully in %.2fs", execution_time)
                 
-                return json.dumps({
+                return _dumps({
                     "document_response": api_response,
                     "template_used": template,
                     "fields_populated": count_populated_fields(document_values),
@@ -100,14 +105,14 @@ def create_document_generation_tools():
                 })
                 
             except Exception as e:
-                print(f"❌ Document generation failed: {e}")
-                return json.dumps({
+                logger.error("❌ Document generation failed: %s", e)
+                return _dumps({
                     "error": str(e),
                     "status": "error"
                 })
                 
         except Exception as e:
-            return json.dumps({"error": str(e), "status": "error"})
+            return _dumps({"error": str(e), "status": "error"})
     
     return [plan_document_generation, parse_and_generate_document]
 
@@ -173,7 +178,7 @@ def execute_document_api_call(tool_config: Dict, params: Dict) -> Dict:
     headers = execution_info.get('headers', {})
     timeout = execution_info.get('timeout', 60)
     
-    print(f"🌐 Making {method} request to {url}")
+    logger.debug("🌐 Making %s request to %s", method, url)
     
     try:
         # Handle POST request with JSON body
@@ -184,32 +189,32 @@ def execute_document_api_call(tool_config: Dict, params: Dict) -> Dict:
                 body_key = body_map.get(param_name, param_name)
                 request_body[body_key] = param_value
         
-        print(f"📋 Request body keys: {list(request_body.keys())}")
-        print(f"📋 Document template: {request_body.get('template', 'unknown')}")
+        logger.debug("📋 Request body keys: %s", list(request_body.keys()))
+        logger.debug("📋 Document template: %s", request_body.get('template', 'unknown'))
         
         # Safe logging of complex objects - avoid f-string formatting errors
         document_values = request_body.get('documentValues', {})
         if document_values:
             table0_items = document_values.get('table0Items', [])
             table1_items = document_values.get('table1Items', [])
-            print(f"📊 Table0 items count: {len(table0_items)}")
-            print(f"📊 Table1 items count: {len(table1_items)}")
+            logger.debug("📊 Table0 items count: %s", len(table0_items))
+            logger.debug("📊 Table1 items count: %s", len(table1_items))
             
             # Safe sample logging without direct dict in f-string
             if table0_items:
                 try:
                     sample_item = table0_items[0]
                     if isinstance(sample_item, dict):
-                        print(f"📊 Sample table0 item keys: {list(sample_item.keys())}")
+                        logger.debug("📊 Sample table0 item keys: %s", list(sample_item.keys()))
                     else:
-                        print("📊 Sample table0 item: not a dictionary")
+                        logger.debug("📊 Sample table0 item: not a dictionary")
                 except:
-                    print("📊 Sample table0 item: could not parse")
+                    logger.debug("📊 Sample table0 item: could not parse")
         
-        response = requests.post(url, json=request_body, headers=headers, timeout=timeout)
+        response = http_session.post(url, json=request_body, headers=headers, timeout=timeout)
         
         response.raise_for_status()
-        print(f"✅ API call successful: {response.status_code}")
+        logger.info("✅ API call successful: %s", response.status_code)
         
         try:
             return response.json()
@@ -217,16 +222,16 @@ def execute_document_api_call(tool_config: Dict, params: Dict) -> Dict:
             return {"response_text": response.text, "status_code": response.status_code}
             
     except Exception as e:
-        print(f"❌ API call failed: {str(e)}")
+        logger.error("❌ API call failed: %s", str(e))
         raise Exception(f"Document API call failed: {str(e)}")
 
+@functools.lru_cache(maxsize=1)
 def build_document_system_prompt() -> str:
     """Build system prompt for document generation agent"""
     
     try:
         # Load tools to create dynamic prompt
-        with open("agents/docs/tools.json", 'r') as f:
-            tools_config = json.load(f)
+        tools_config = load_tool_specs("agents/docs/tools.json")
         
         # Create tool descriptions
         tool_descriptions = []
@@ -238,7 +243,7 @@ def build_document_system_prompt() -> str:
         tools_text = "\n".join(tool_descriptions)
         
     except Exception as e:
-        print(f"⚠️ Could not load tools for dynamic prompt: {e}")
+        logger.warning("⚠️ Could not load tools for dynamic prompt: %s", e)
         tools_text = "- generate_document_report: Generate reports using templates"
     
     return f"""You are a document/report generation agent that creates professional documents using a 2-phase workflow:
@@ -373,10 +378,11 @@ async def process_document_generation_request(user_input: str) -> Dict[str, Any]
         # Use the document generation agent
         doc_agent = build_document_generation_agent()
         
-        print(f"📄 Starting document generation for request...")
+        logger.debug("📄 Starting document generation for request...")
         
-        # Let the agent handle the workflow
-        result = doc_agent.invoke({
+        # Run the blocking invocation on a worker thread so the event
+        # loop stays free while the LLM and PDF API round-trips run
+        result = await asyncio.to_thread(doc_agent.invoke, {
             "messages": [{"role": "user", "content": user_input}]
         })
         
@@ -1,13 +1,23 @@
 from langgraph.prebuilt import create_react_agent
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.tools import tool
-import json
+from common.tool_loader import load_tool_specs
+from common.http import session as http_session
+from common.jsonio import dumps as _dumps, parse_lenient_json as _parse_lenient_json
+import asyncio
+import functools
+import logging
 import os
 from typing import Dict, Any, List
-import requests
 import time
 from datetime import datetime, timedelta
 
+logger = logging.getLogger(__name__)
+
+# Shared across invocations - single-word indicators matched via set intersection
+INCIDENT_INDICATORS = frozenset({"error", "down", "failed", "issue", "problem", "alert", "outage", "incident"})
+RESOLUTION_INDICATORS = frozenset({"fixed", "resolved", "working", "restored", "deployed", "updated", "solved"})
+
 def create_summariser_workflow_tools():
     """Create tools for summariser workflow: Fetch -> Analyze -> Create Notion Doc"""
     
@@ -52,19 +62,18 @@ def create_summariser_workflow_tools():
     def fetch_slack_messages_mcp(channel_id: str, hours_back: int = 24) -> str:
         """PHASE 1: Fetch messages from Slack channel using MCP server"""
         try:
-            print(f"Fetching messages from channel {channel_id} via MCP server...")
+            logger.debug("Fetching messages from channel %s via MCP server...", channel_id)
             
             # Load MCP tools configuration
             try:
-                with open("agents/summariser/tools.json", "r") as f:
-                    tools_config = json.load(f)
+                tools_config = load_tool_specs("agents/summariser/tools.json")
             except Exception as e:
-                return json.dumps({"error": f"Could not load tools config: {e}", "status": "error"})
+                return _dumps({"error": f"Could not load tools config: {e}", "status": "error"})
             
             # Find MCP Slack tool
             mcp_slack_tool = next((tool for tool in tools_config if tool["name"] == "get_slack_messages"), None)
             if not mcp_slack_tool:
-                return json.dumps({"error": "MCP Slack tool not configured", "status": "error"})
+                return _dumps({"error": "MCP Slack tool not configured", "status": "error"})
             
             # Execute MCP API call to fetch messages
             api_response = execute_mcp_api_call(mcp_slack_tool, {
@@ -73,9 +82,9 @@ def create_summariser_workflow_tools():
             })
             
             messages = api_response.get("messages", [])
-            print(f"Fetched {len(messages)} messages from MCP Slack API")
+            logger.debug("Fetched %d messages from MCP Slack API", len(messages))
             
-            return json.dumps({
+            return _dumps({
                 "channel_id": channel_id,
                 "message_count": len(messages),
                 "messages": messages,
@@ -84,37 +93,44 @@ def create_summariser_workflow_tools():
             })
             
         except Exception as e:
-            return json.dumps({"error": str(e), "status": "error"})
+            return _dumps({"error": str(e), "status": "error"})
     
     @tool
     def analyze_and_create_rca_template(messages_json: str) -> str:
         """PHASE 2: Analyze messages and create RCA template structure"""
         try:
-            messages_data = json.loads(messages_json)
+            messages_data = _parse_lenient_json(messages_json)
             if messages_data.get("status") != "success":
-                return json.dumps({"error": "Invalid messages data", "status": "error"})
+                return _dumps({"error": "Invalid messages data", "status": "error"})
             
             messages = messages_data.get("messages", [])
             channel_id = messages_data.get("channel_id")
-            print(f"Analyzing {len(messages)} messages for RCA creation...")
-            
-            # Extract key information for RCA
-            incident_indicators = ["error", "down", "failed", "issue", "problem", "alert", "outage", "incident"]
-            resolution_indicators = ["fixed", "resolved", "working", "restored", "deployed", "updated", "solved"]
+            logger.debug("Analyzing %d messages for RCA creation...", len(messages))
             
+            # Accumulate only up to the display caps; totals are tracked as
+            # plain counters so memory stays O(limit) for long channels
             incidents = []
             resolutions = []
             timeline = []
-            
+            incident_count = 0
+            resolution_count = 0
+
             for msg in messages:
                 msg_text = msg.get("text", "").lower() if isinstance(msg, dict) else str(msg).lower()
                 msg_formatted = msg if isinstance(msg, dict) else {"text": str(msg), "timestamp": "unknown"}
-                
-                if any(indicator in msg_text for indicator in incident_indicators):
-                    incidents.append(msg_formatted)
-                if any(indicator in msg_text for indicator in resolution_indicators):
-                    resolutions.append(msg_formatted)
-                timeline.append(msg_formatted)
+
+                # O(1) per-word lookups against the module-level frozensets
+                words = set(msg_text.split())
+                if words & INCIDENT_INDICATORS:
+                    incident_count += 1
+                    if len(incidents) < 10:
+                        incidents.append(msg_formatted)
+                if words & RESOLUTION_INDICATORS:
+                    resolution_count += 1
+                    if len(resolutions) < 10:
+                        resolutions.append(msg_formatted)
+                if len(timeline) < 20:
+                    timeline.append(msg_formatted)
             
             # Create RCA template structure
             rca_template = {
@@ -122,19 +138,19 @@ def create_summariser_workflow_tools():
                 "sections": {
                     "incident_overview": {
                         "title": "## Incident Overview",
-                        "content": f"**Channel:** {channel_id}\n**Analysis Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n**Messages Analyzed:** {len(messages)}\n**Incidents Detected:** {len(incidents)}\n**Resolutions Found:** {len(resolutions)}"
+                        "content": f"**Channel:** {channel_id}\n**Analysis Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n**Messages Analyzed:** {len(messages)}\n**Incidents Detected:** {incident_count}\n**Resolutions Found:** {resolution_count}"
                     },
                     "timeline": {
                         "title": "## Timeline",
-                        "content": _format_timeline(timeline[:20])  # Fixed: removed self.
+                        "content": _format_timeline(timeline)  # Fixed: removed self.
                     },
                     "incident_details": {
                         "title": "## Incident Details", 
-                        "content": _format_messages(incidents[:10], "incident")  # Fixed: removed self.
+                        "content": _format_messages(incidents, "incident")  # Fixed: removed self.
                     },
                     "resolution_actions": {
                         "title": "## Resolution Actions",
-                        "content": _format_messages(resolutions[:10], "resolution")  # Fixed: removed self.
+                        "content": _format_messages(resolutions, "resolution")  # Fixed: removed self.
                     },
                     "root_cause_analysis": {
                         "title": "## Root Cause Analysis",
@@ -147,42 +163,41 @@ def create_summariser_workflow_tools():
                 }
             }
             
-            return json.dumps({
+            return _dumps({
                 "channel_id": channel_id,
                 "rca_template": rca_template,
                 "analysis_summary": {
                     "total_messages": len(messages),
-                    "incidents_found": len(incidents),
-                    "resolutions_found": len(resolutions),
-                    "timeline_entries": len(timeline)
+                    "incidents_found": incident_count,
+                    "resolutions_found": resolution_count,
+                    "timeline_entries": len(messages)
                 },
                 "status": "success"
             })
             
         except Exception as e:
-            return json.dumps({"error": str(e), "status": "error"})
+            return _dumps({"error": str(e), "status": "error"})
     
     @tool
     def create_notion_document_mcp(template_json: str) -> str:
         """PHASE 3: Create Notion document using MCP server (auto-posts to Slack)"""
         try:
-            template_data = json.loads(template_json)
+            template_data = _parse_lenient_json(template_json)
             if template_data.get("status") != "success":
-                return json.dumps({"error": "Invalid template data", "status": "error"})
+                return _dumps({"error": "Invalid template data", "status": "error"})
             
-            print("Creating Notion RCA document via MCP server...")
+            logger.debug("Creating Notion RCA document via MCP server...")
             
             # Load MCP tools configuration
             try:
-                with open("agents/summariser/tools.json", "r") as f:
-                    tools_config = json.load(f)
+                tools_config = load_tool_specs("agents/summariser/tools.json")
             except Exception as e:
-                return json.dumps({"error": f"Could not load tools config: {e}", "status": "error"})
+                return _dumps({"error": f"Could not load tools config: {e}", "status": "error"})
             
             # Find MCP Notion tool
             mcp_notion_tool = next((tool for tool in tools_config if tool["name"] == "create_notion_rca"), None)
             if not mcp_notion_tool:
-                return json.dumps({"error": "MCP Notion tool not configured", "status": "error"})
+                return _dumps({"error": "MCP Notion tool not configured", "status": "error"})
             
             rca_template = template_data.get("rca_template")
             channel_id = template_data.get("channel_id")
@@ -197,7 +212,7 @@ def create_summariser_workflow_tools():
             notion_url = api_response.get("notion_url", "")
             success = api_response.get("success", False)
             
-            return json.dumps({
+            return _dumps({
                 "notion_url": notion_url,
                 "channel_id": channel_id,
                 "title": rca_template["title"],
@@ -208,7 +223,7 @@ def create_summariser_workflow_tools():
             })
             
         except Exception as e:
-            return json.dumps({"error": str(e), "status": "error"})
+            return _dumps({"error": str(e), "status": "error"})
     
     return fetch_slack_messages_mcp, analyze_and_create_rca_template, create_notion_document_mcp
 
@@ -220,7 +235,7 @@ def execute_mcp_api_call(tool_config: Dict, params: Dict) -> Dict:
     headers = execution_info.get("headers", {})
     timeout = execution_info.get("timeout", 30)
     
-    print(f"Making {method} request to MCP server: {url}")
+    logger.debug("Making %s request to MCP server: %s", method, url)
     
     try:
         body_map = execution_info.get("body_map", {})
@@ -231,25 +246,33 @@ def execute_mcp_api_call(tool_config: Dict, params: Dict) -> Dict:
                 body_key = body_map.get(param_name, param_name)
                 request_body[body_key] = param_value
         
-        print(f"MCP request body keys: {list(request_body.keys())}")
+        logger.debug("MCP request body keys: %s", list(request_body.keys()))
         
         if method == "GET":
-            response = requests.get(url, params=request_body, headers=headers, timeout=timeout)
+            response = http_session.get(url, params=request_body, headers=headers, timeout=timeout)
         else:
-            response = requests.post(url, json=request_body, headers=headers, timeout=timeout)
-        
-        response.raise_for_status()
-        print(f"MCP API call successful: {response.status_code}")
-        
-        try:
+            response = http_session.post(url, json=request_body, headers=headers, timeout=timeout)
+
+        # Explicit status check so callers can distinguish client vs server errors
+        # without paying for an exception raised from deep inside requests
+        if response.status_code >= 400:
+            error_kind = "client error" if response.status_code < 500 else "server error"
+            raise Exception(f"MCP API {error_kind}: {response.status_code} - {response.text[:200]}")
+
+        logger.debug("MCP API call successful: %s", response.status_code)
+
+        # Check Content-Type instead of try/except around response.json() -
+        # avoids exception-based control flow on non-JSON happy paths
+        content_type = response.headers.get("content-type", "")
+        if "application/json" in content_type:
             return response.json()
-        except:
-            return {"response_text": response.text, "status_code": response.status_code}
+        return {"response_text": response.text, "status_code": response.status_code}
             
     except Exception as e:
-        print(f"MCP API call failed: {str(e)}")
+        logger.warning("MCP API call failed: %s", e)
         raise Exception(f"MCP API call failed: {str(e)}")
 
+@functools.lru_cache(maxsize=1)
 def build_summariser_system_prompt() -> str:
     """Build system prompt for summariser agent using MCP server"""
     return """You are a specialized RCA (Root Cause Analysis) summariser agent that creates incident documentation from Slack conversations using MCP server APIs.
@@ -320,9 +343,14 @@ async def process_summariser_request(user_input: str) -> Dict[str, Any]:
     """Process RCA summariser request via MCP server"""
     try:
         summariser_agent = build_summariser_agent()
-        print(f"Starting MCP RCA summariser workflow for: {user_input[:100]}...")
+        logger.info("Starting MCP RCA summariser workflow for: %s...", user_input[:100])
         
-        result = summariser_agent.invoke({"messages": [{"role": "user", "content": user_input}]})
+        # Worker thread keeps the event loop responsive during the
+        # LLM and MCP round-trips
+        result = await asyncio.to_thread(
+            summariser_agent.invoke,
+            {"messages": [{"role": "user", "content": user_input}]},
+        )
         
         if result and "messages" in result and result["messages"]:
             final_message = result["messages"][-1]
@@ -1,9 +1,13 @@
 import asyncio
+import logging
+import logging.handlers
+import os
+import queue
 import threading
 import time
-import json
 import uuid
-from flask import Flask, request, jsonify
+import orjson
+from flask import Flask, request, Response
 from concurrent.futures import ThreadPoolExecutor
 import dotenv
 
@@ -11,8 +15,21 @@ dotenv.load_dotenv()
 
 from supervisor import process_supervisor_request, extract_recipients_from_query
 
+# Lazy %s formatting plus a queue handler: the request thread only enqueues
+# records, the stdout write happens on the listener's background thread.
+log = logging.getLogger("scout")
+log.setLevel(os.getenv("LOG_LEVEL", "INFO"))
+_log_queue = queue.SimpleQueue()
+log.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+
 app = Flask(__name__)
 
+def json_response(payload, status=200):
+    """Serialize a response with orjson instead of Flask's jsonify"""
+    return Response(orjson.dumps(payload), status=status, mimetype="application/json")
+
 # Store task results in memory (use Redis in production)
 task_results = {}
 executor = ThreadPoolExecutor(max_workers=2)
@@ -20,38 +37,34 @@ executor = ThreadPoolExecutor(max_workers=2)
 def run_supervisor_task(task_id, query):
     """Run supervisor task in background"""
     try:
-        print(f"🚀 Starting task {task_id}")
+        log.info("🚀 Starting task %s", task_id)
         task_results[task_id] = {"status": "running", "progress": "Starting..."}
         
-        # Run the supervisor request
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(process_supervisor_request(query))
-        finally:
-            loop.close()
-        
+        # Single event-loop entry per request - one supervisor run, no duplicate
+        # agent invocation afterwards
+        result = asyncio.run(process_supervisor_request(query))
+
         # Store results
         if result.get('status') == 'success':
             task_results[task_id] = {
                 "status": "completed",
                 "result": result.get('response', ''),
-                "execution_time": time.time() - task_results[task_id].get('start_time', time.time())
+                "execution_time": time.perf_counter() - task_results[task_id].get('start_time', time.perf_counter())
             }
-            print(f"✅ Task {task_id} completed successfully")
+            log.info("✅ Task %s completed successfully", task_id)
         else:
             task_results[task_id] = {
                 "status": "failed", 
                 "error": result.get('error', 'Unknown error')
             }
-            print(f"❌ Task {task_id} failed")
+            log.info("❌ Task %s failed", task_id)
             
     except Exception as e:
         task_results[task_id] = {
             "status": "failed",
             "error": str(e)
         }
-        print(f"💥 Task {task_id} exception: {e}")
+        log.exception("💥 Task %s exception", task_id)
 
 @app.route('/')
 def hello_world():
@@ -62,10 +75,17 @@ def handle_async_query():
     """Start async query and return task ID immediately"""
     try:
         body = request.json or {}
-        query = json.dumps(body)
-        
+        # The supervisor wants the user's query text - pull it straight out
+        # of the parsed body instead of re-serializing the whole dict only
+        # for downstream code to parse it again. A non-string "query" (dict,
+        # number) is treated as absent so it takes the serialized-body path
+        # instead of blowing up downstream string handling.
+        query = body.get("query") if isinstance(body, dict) else None
+        if not isinstance(query, str) or not query:
+            query = orjson.dumps(body).decode() if body else ""
+
         if not query:
-            return jsonify({"error": "No query provided"}), 400
+            return json_response({"error": "No query provided"}, status=400)
         
         # Generate unique task ID
         task_id = str(uuid.uuid4())
@@ -75,45 +95,47 @@ def handle_async_query():
             "status": "queued",
             "query": query,
             "recipients": extract_recipients_from_query(query),
-            "start_time": time.time()
+            # perf_counter: monotonic and cheaper than time.time(), and these
+            # timestamps are only ever used for durations
+            "start_time": time.perf_counter()
         }
         
         # Start background task
         executor.submit(run_supervisor_task, task_id, query)
         
-        print(f"📋 Started async task {task_id} for query: {query[:50]}...")
+        log.debug("📋 Started async task %s for query: %.50s...", task_id, query)
         
         # Return immediately with task ID
-        return jsonify({
+        return json_response({
             "status": "accepted",
             "task_id": task_id,
             "message": "Task started successfully",
             "recipients": extract_recipients_from_query(query),
             "check_status_url": f"/status/{task_id}"
-        }), 202
+        }, status=202)
         
     except Exception as e:
-        print(f"❌ Error starting task: {e}")
-        return jsonify({"error": str(e)}), 500
+        log.error("❌ Error starting task: %s", e)
+        return json_response({"error": str(e)}, status=500)
 
 @app.route('/status/<task_id>', methods=['GET'])
 def get_task_status(task_id):
     """Check status of async task"""
     if task_id not in task_results:
-        return jsonify({"error": "Task not found"}), 404
+        return json_response({"error": "Task not found"}, status=404)
     
     task_info = task_results[task_id].copy()
     
     # Add runtime if still running
     if task_info["status"] == "running":
-        task_info["runtime"] = f"{time.time() - task_info.get('start_time', time.time()):.1f}s"
+        task_info["runtime"] = f"{time.perf_counter() - task_info.get('start_time', time.perf_counter()):.1f}s"
     
-    return jsonify(task_info)
+    return json_response(task_info)
 
 @app.route('/tasks', methods=['GET'])
 def list_tasks():
     """List all tasks"""
-    return jsonify({
+    return json_response({
         "tasks": [
             {"task_id": tid, "status": info["status"], "query": info.get("query", "")[:50]}
             for tid, info in task_results.items()
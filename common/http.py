@@ -0,0 +1,18 @@
+# common/http.py
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# One pooled session shared by every agent's API executor. Keep-alive means
+# repeat calls to the same backend reuse the socket instead of paying a new
+# TCP + TLS handshake per tool invocation; the retry policy smooths over
+# transient connection resets without changing call-site behaviour.
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=128,
+    max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=(429, 502, 503, 504)),
+)
+
+session = requests.Session()
+session.mount("http://", _adapter)
+session.mount("https://", _adapter)
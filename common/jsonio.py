@@ -0,0 +1,30 @@
+# common/jsonio.py
+import json
+
+import orjson
+
+_JSON_DECODER = json.JSONDecoder()
+
+def dumps(obj) -> str:
+    """Serialize tool payloads with orjson (decoded - tools return str)"""
+    return orjson.dumps(obj).decode()
+
+def parse_lenient_json(text: str):
+    """Parse JSON the LLM may have wrapped in fences or prose
+
+    Fast path is a straight orjson.loads; on failure, scan left to right
+    for the first value that raw_decode can consume - a single O(n) pass
+    with no greedy-regex backtracking.
+    """
+    try:
+        return orjson.loads(text)
+    except (ValueError, TypeError):
+        pass
+    for i, ch in enumerate(text):
+        if ch in '{[':
+            try:
+                obj, _ = _JSON_DECODER.raw_decode(text[i:])
+                return obj
+            except ValueError:
+                continue
+    raise ValueError(f"No JSON value found in: {text[:100]!r}")
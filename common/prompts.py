@@ -1,7 +1,10 @@
+import functools
+import sys
+import types
 from typing import Optional, Dict
 
-# Agent-specific system prompts
-AGENT_PROMPTS = {
+# Agent-specific system prompts (keys are lowercase agent types)
+_AGENT_PROMPTS = {
     "db": """
 You are a database agent specialized in fetching and retrieving data from various databases and APIs.
 
@@ -108,6 +111,14 @@ Guidelines:
 No manual Slack posting needed - MCP server completes the full workflow."""
 }
 
+# Intern the prompt bodies so every lookup hands back the same string
+# object (identical ids let downstream prompt caches key cheaply), and
+# publish a read-only view so call sites can't mutate prompts in place -
+# add_agent_prompt below is the one sanctioned write path.
+for _agent_type in _AGENT_PROMPTS:
+    _AGENT_PROMPTS[_agent_type] = sys.intern(_AGENT_PROMPTS[_agent_type])
+AGENT_PROMPTS = types.MappingProxyType(_AGENT_PROMPTS)
+
 # Default fallback prompt
 DEFAULT_PROMPT = """
 You are a helpful AI assistant with access to specialized tools.
@@ -135,8 +146,8 @@ def get_agent_prompt(agent_type: str) -> Optional[str]:
     Returns:
         System prompt string or None if not found
     """
-    
-    return AGENT_PROMPTS.get(agent_type.lower())
+
+    return AGENT_PROMPTS.get(agent_type if agent_type.islower() else agent_type.lower())
 
 def get_all_agent_types() -> list:
     """
@@ -156,21 +167,29 @@ def add_agent_prompt(agent_type: str, prompt: str) -> None:
         agent_type: Type of agent
         prompt: System prompt string
     """
-    
-    AGENT_PROMPTS[agent_type.lower()] = prompt
 
+    _AGENT_PROMPTS[agent_type.lower()] = sys.intern(prompt)
+    # Built prompts embed the base prompt, so drop anything memoized
+    get_enhanced_prompt.cache_clear()
+    _build_custom_prompt.cache_clear()
+
+@functools.lru_cache(maxsize=256)
 def get_enhanced_prompt(agent_type: str, additional_context: str = "") -> str:
     """
     Get enhanced prompt with additional context
-    
+
+    Memoized - supervisor loops rebuild the same (agent, context) pair
+    repeatedly, and returning the identical string keeps provider-side
+    prompt caches hitting too.
+
     Args:
         agent_type: Type of agent
         additional_context: Extra context to append to the prompt
-    
+
     Returns:
         Enhanced system prompt
     """
-    
+
     base_prompt = get_agent_prompt(agent_type) or DEFAULT_PROMPT
     
     if additional_context:
@@ -179,30 +198,64 @@ def get_enhanced_prompt(agent_type: str, additional_context: str = "") -> str:
     
     return base_prompt
 
-def create_custom_prompt_template(agent_type: str, custom_instructions: Dict[str, str]) -> str:
+# Marker callers can use to split a built prompt back into its static
+# prefix and dynamic tail when tagging the prefix for provider-side
+# prompt caching - cache hits require a byte-identical prefix.
+PROMPT_CACHE_BOUNDARY = "\n\n---DYNAMIC---\n\n"
+
+def get_prompt_parts(agent_type: str, additional_context: str = "") -> tuple:
     """
-    Create a customized prompt template with specific instructions
-    
+    Get an enhanced prompt split into (prefix, suffix)
+
+    The prefix is the static base prompt - safe to tag with a provider
+    cache-control marker - and the suffix carries all per-call context.
+
     Args:
         agent_type: Type of agent
-        custom_instructions: Dictionary of custom instructions to include
-    
+        additional_context: Extra context for the dynamic suffix
+
     Returns:
-        Customized system prompt
+        Tuple of (static prefix, dynamic suffix); suffix is "" when no
+        context is given
     """
-    
+
     base_prompt = get_agent_prompt(agent_type) or DEFAULT_PROMPT
-    
+
+    if additional_context:
+        return base_prompt, f"Additional Context:\n{additional_context}"
+
+    return base_prompt, ""
+
+@functools.lru_cache(maxsize=256)
+def _build_custom_prompt(agent_type: str, instruction_items: tuple) -> str:
+    """Cached body of create_custom_prompt_template (dicts aren't hashable)"""
+
+    base_prompt = get_agent_prompt(agent_type) or DEFAULT_PROMPT
+
     custom_sections = []
-    for section_name, instruction in custom_instructions.items():
+    for section_name, instruction in instruction_items:
         custom_sections.append(f"{section_name}:\n{instruction}")
-    
+
     if custom_sections:
         custom_prompt = f"{base_prompt}\n\nCustom Instructions:\n" + "\n\n".join(custom_sections)
         return custom_prompt
-    
+
     return base_prompt
 
+def create_custom_prompt_template(agent_type: str, custom_instructions: Dict[str, str]) -> str:
+    """
+    Create a customized prompt template with specific instructions
+
+    Args:
+        agent_type: Type of agent
+        custom_instructions: Dictionary of custom instructions to include
+
+    Returns:
+        Customized system prompt
+    """
+
+    return _build_custom_prompt(agent_type, tuple(sorted(custom_instructions.items())))
+
 # Example usage and testing
 if __name__ == "__main__":
     # Test prompt retrieval
@@ -1,18 +1,495 @@
 # common/tool_loader.py
-import json
-from typing import List, Dict, Any
+from __future__ import annotations
 
-def load_tools_from_json(filepath: str) -> List[Dict[str, Any]]:
-    """Load tool configurations as dictionaries for API execution"""
+import asyncio
+import atexit
+import functools
+import hashlib
+import logging
+import os
+import re
+import string
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type
+
+import orjson
+from cachetools import TTLCache
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+    from langchain_core.tools import StructuredTool
+
+logger = logging.getLogger(__name__)
+
+# httpx, pydantic, and langchain are only imported when the first tool is
+# actually built - keeping them out of module import trims cold-start on
+# processes that never touch this loader.
+
+@functools.lru_cache(maxsize=1)
+def _http_client():
+    """One pooled client shared by every HTTP tool executor
+
+    Keep-alive (and HTTP/2 where the backend speaks it) means repeat tool
+    calls reuse the socket instead of paying a TCP+TLS handshake per
+    invocation.
+    """
+    import httpx
+    client = httpx.Client(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+        timeout=httpx.Timeout(20.0),
+    )
+    atexit.register(client.close)
+    return client
+
+# Async primitives bind to the event loop they are first awaited on, but
+# the app runs one asyncio.run per request thread - a single loop-bound
+# client or semaphore would work for the first request and then raise
+# "bound to a different event loop". Keep one (client, semaphore) pair per
+# running loop instead, pruning entries once their loop has closed (the
+# client can't be aclose()d on a dead loop; dropping the reference lets
+# GC reclaim its sockets).
+_ASYNC_STATE: Dict[asyncio.AbstractEventLoop, tuple] = {}
+_ASYNC_STATE_LOCK = threading.Lock()
+
+def _async_http_state():
+    """Pooled AsyncClient and fan-out semaphore for the running event loop
+
+    The semaphore bounds concurrent async tool calls so fan-out doesn't
+    overwhelm upstream APIs. Must be called from inside a running loop.
+    """
+    import httpx
+    loop = asyncio.get_running_loop()
+    with _ASYNC_STATE_LOCK:
+        state = _ASYNC_STATE.get(loop)
+        if state is None:
+            for stale in [l for l in _ASYNC_STATE if l.is_closed()]:
+                del _ASYNC_STATE[stale]
+            state = (
+                httpx.AsyncClient(
+                    http2=True,
+                    limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+                    timeout=httpx.Timeout(20.0),
+                ),
+                asyncio.Semaphore(16),
+            )
+            _ASYNC_STATE[loop] = state
+    return state
+
+# Compiled parameter models keyed by a digest of their JSON schema - model
+# construction (validator compilation) is the expensive step of tool
+# loading, and many tools share schema shapes, so identical schemas reuse
+# the same class across loads and hot-reloads.
+_MODEL_CACHE: Dict[str, Type[BaseModel]] = {}
+
+_JSON_TYPE_MAP = {
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
+
+def _schema_key(schema: Dict) -> str:
+    """Stable digest of a JSON schema for the model cache"""
+    return hashlib.blake2b(
+        orjson.dumps(schema, option=orjson.OPT_SORT_KEYS), digest_size=16
+    ).hexdigest()
+
+def _json_type_to_python(param_config: Dict):
+    """Map a JSON-schema property to a Python annotation"""
+    param_type = param_config.get("type", "string")
+    if isinstance(param_type, list):
+        # e.g. ["string", "null"] - optional parameter
+        non_null = next((t for t in param_type if t != "null"), "string")
+        return Optional[_JSON_TYPE_MAP.get(non_null, str)]
+    return _JSON_TYPE_MAP.get(param_type, str)
+
+def create_parameter_model(tool_name: str, schema: Dict) -> Type[BaseModel]:
+    """Build (or fetch) the Pydantic model for a tool's parameters
+
+    Enum constraints are enforced with validators so invalid values are
+    rejected before any HTTP call goes out.
+    """
+    key = _schema_key(schema)
+    cached = _MODEL_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    from pydantic import create_model
+
+    properties = schema.get("properties", {})
+    required = set(schema.get("required", []))
+    has_constraints = any(
+        "enum" in p or "minimum" in p or "maximum" in p or "pattern" in p
+        for p in properties.values()
+    )
+
+    fields = {}
+    for param_name, param_config in properties.items():
+        annotation = _json_type_to_python(param_config)
+        enum_values = param_config.get("enum")
+        if enum_values:
+            # Literal of the allowed values - pydantic rejects anything else
+            from typing import Literal
+            annotation = Literal[tuple(enum_values)]
+            if param_name not in required:
+                annotation = Optional[annotation]
+        default = ... if param_name in required else None
+        fields[param_name] = (annotation, default)
+
+    model = create_model(f"{tool_name}_params", **fields)
+    # Lets executor paths skip a validation round-trip for plain typed
+    # schemas - only constrained schemas need the full pydantic pass.
+    model.__has_constraints__ = has_constraints
+    _MODEL_CACHE[key] = model
+    return model
+
+# json_schema_to_pydantic is the historical name for the same conversion
+json_schema_to_pydantic = create_parameter_model
+
+_VALIDATOR_CACHE: Dict[str, Any] = {}
+
+def compile_schema_validator(schema: Dict):
+    """Compile a schema into a fastjsonschema validator, if available
+
+    fastjsonschema generates straight-line Python per schema - roughly an
+    order of magnitude faster than a pydantic pass for plain args dicts.
+    It's an optional dependency: returns None when not installed, and
+    callers fall back to the pydantic model. Cached by schema digest.
+    """
+    key = _schema_key(schema)
+    if key in _VALIDATOR_CACHE:
+        return _VALIDATOR_CACHE[key]
+
+    try:
+        import fastjsonschema
+    except ImportError:
+        validator = None
+    else:
+        validator = fastjsonschema.compile(schema)
+    _VALIDATOR_CACHE[key] = validator
+    return validator
+
+def _constraint_validator(spec: Dict):
+    """Compiled args guard for a spec's executor, or None
+
+    Direct executor calls bypass langchain's pydantic pass entirely, so
+    constrained schemas get their compiled validator wired into run().
+    Constraint-free schemas (per __has_constraints__) and environments
+    without fastjsonschema skip validation - types there are advisory.
+    """
+    schema = spec.get("parameters", {})
+    if not schema.get("properties"):
+        return None
+    model = create_parameter_model(spec.get("name", "tool"), schema)
+    if not model.__has_constraints__:
+        return None
+    return compile_schema_validator(schema)
+
+_ENV_RE = re.compile(r"\$\{([^}:]+)(?::([^}]*))?\}")
+
+def _env_replacer(match):
+    var_name, default = match.group(1), match.group(2)
+    return os.getenv(var_name, default if default is not None else "")
+
+def _expand_env(template: str) -> str:
+    """Interpolate ${VAR} / ${VAR:default} sequences from the environment"""
+    if "${" not in template:
+        return template
+    return _ENV_RE.sub(_env_replacer, template)
+
+# Historical alias kept for callers of the old name
+safe_env_interpolation = _expand_env
+
+# Short-lived cache for idempotent GET tool calls - agents repeat the same
+# lookups across retries and multi-step plans, and each repeat otherwise
+# costs a network round-trip plus the tokens to re-digest the response.
+_GET_CACHE = TTLCache(maxsize=512, ttl=300)
+# TTLCache mutates internal state on reads (expiry bookkeeping), so every
+# access goes through this lock - executors run from worker threads and
+# event loops concurrently.
+_GET_CACHE_LOCK = threading.Lock()
+
+def bust_cache() -> None:
+    """Drop all cached GET responses (call after write-style tools)"""
+    with _GET_CACHE_LOCK:
+        _GET_CACHE.clear()
+
+def make_http_executor(spec: Dict):
+    """Build the callable that performs a tool's HTTP request"""
+    execution = spec.get("execution", {})
+    method = execution.get("method", "GET").upper()
+    timeout = execution.get("timeout", 30)
+
+    # Templates are static per spec, so interpolate them once here; per-call
+    # expansion only happens for the rare template that references env vars.
+    url_template = execution.get("url", "")
+    headers_template = execution.get("headers", {})
+    static_url = _expand_env(url_template)
+    static_headers = {k: _expand_env(v) for k, v in headers_template.items()}
+    headers_dynamic = any("${" in v for v in headers_template.values())
+
+    # Parameter renaming and method dispatch are fixed per spec - resolve
+    # both to closures here so run() does no per-call branching.
+    query_map = execution.get("query_map", {})
+    body_map = execution.get("body_map", execution.get("body", {}))
+    key_map = query_map if method == "GET" else body_map
+    client = _http_client()
+
+    fields = tuple(spec.get("parameters", {}).get("properties", {}))
+    if key_map and fields:
+        # Schema fields are known up front, so the src->dst rename pairs
+        # compile to a tuple here and run() does no dict.get per param.
+        _pairs = tuple((f, key_map.get(f, f)) for f in fields)
+        def _map_params(params):
+            return {dst: params[src] for src, dst in _pairs
+                    if src in params and params[src] is not None}
+    elif key_map:
+        _rename = key_map.get
+        def _map_params(params):
+            return {_rename(k, k): v for k, v in params.items() if v is not None}
+    else:
+        def _map_params(params):
+            return {k: v for k, v in params.items() if v is not None}
+
+    # The _fetch closure returns the raw response body. Specs marking
+    # "stream": true accumulate chunks into a bytearray instead of letting
+    # httpx buffer body + decoded str simultaneously - roughly halves peak
+    # memory on multi-MB payloads.
+    if execution.get("stream", False):
+        _kwargs = (lambda m: {"params": m}) if method == "GET" else (lambda m: {"json": m})
+        def _fetch(url, mapped, headers):
+            buf = bytearray()
+            with client.stream(method, url, headers=headers, timeout=timeout, **_kwargs(mapped)) as response:
+                response.raise_for_status()
+                for chunk in response.iter_bytes():
+                    buf.extend(chunk)
+            return bytes(buf)
+    elif method == "GET":
+        def _fetch(url, mapped, headers):
+            response = client.get(url, params=mapped, headers=headers, timeout=timeout)
+            response.raise_for_status()
+            return response.content
+    else:
+        def _fetch(url, mapped, headers):
+            response = client.request(method, url, json=mapped, headers=headers, timeout=timeout)
+            response.raise_for_status()
+            return response.content
+
+    cacheable = method == "GET" and not execution.get("no_cache", False)
+    _validate = _constraint_validator(spec)
+
+    # Specs with a fixed response structure can declare a response_template
+    # ($field placeholders); the rendered text goes straight back to the
+    # user, skipping an LLM pass over structurally repetitive outputs.
+    response_template = spec.get("response_template") or execution.get("response_template")
+    _template = string.Template(response_template) if response_template else None
+
+    def run(**params) -> str:
+        if _validate is not None:
+            # Unset optionals arrive as None - not schema violations
+            _validate({k: v for k, v in params.items() if v is not None})
+
+        url = _expand_env(url_template) if "${" in url_template else static_url
+        if headers_dynamic:
+            headers = {k: _expand_env(v) for k, v in headers_template.items()}
+        else:
+            headers = static_headers
+
+        mapped = _map_params(params)
+        if cacheable:
+            cache_key = hashlib.blake2b(
+                f"{url}|{sorted(mapped.items())}".encode()
+            ).hexdigest()
+            with _GET_CACHE_LOCK:
+                cached = _GET_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+
+        content = _fetch(url, mapped, headers)
+        try:
+            parsed = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            result = content.decode(errors="replace")
+        else:
+            if _template is not None and isinstance(parsed, dict):
+                result = _template.safe_substitute(parsed)
+            else:
+                result = orjson.dumps(parsed).decode()
+
+        if cacheable:
+            with _GET_CACHE_LOCK:
+                _GET_CACHE[cache_key] = result
+        else:
+            # A successful write may invalidate anything we cached earlier
+            bust_cache()
+        return result
+
+    return run
+
+def make_async_http_executor(spec: Dict):
+    """Async variant of make_http_executor for concurrent tool fan-out
+
+    Network waits overlap under asyncio.gather instead of serializing;
+    concurrency is bounded by the running loop's semaphore.
+    """
+    execution = spec.get("execution", {})
+    method = execution.get("method", "GET").upper()
+    timeout = execution.get("timeout", 30)
+
+    url_template = execution.get("url", "")
+    headers_template = execution.get("headers", {})
+    static_url = _expand_env(url_template)
+    static_headers = {k: _expand_env(v) for k, v in headers_template.items()}
+    headers_dynamic = any("${" in v for v in headers_template.values())
+
+    query_map = execution.get("query_map", {})
+    body_map = execution.get("body_map", execution.get("body", {}))
+    key_map = query_map if method == "GET" else body_map
+    cacheable = method == "GET" and not execution.get("no_cache", False)
+    _validate = _constraint_validator(spec)
+
+    async def run(**params) -> str:
+        if _validate is not None:
+            _validate({k: v for k, v in params.items() if v is not None})
+
+        client, semaphore = _async_http_state()
+
+        url = _expand_env(url_template) if "${" in url_template else static_url
+        if headers_dynamic:
+            headers = {k: _expand_env(v) for k, v in headers_template.items()}
+        else:
+            headers = static_headers
+
+        if key_map:
+            mapped = {key_map.get(k, k): v for k, v in params.items() if v is not None}
+        else:
+            mapped = {k: v for k, v in params.items() if v is not None}
+
+        if cacheable:
+            cache_key = hashlib.blake2b(
+                f"{url}|{sorted(mapped.items())}".encode()
+            ).hexdigest()
+            with _GET_CACHE_LOCK:
+                cached = _GET_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+
+        async with semaphore:
+            if method == "GET":
+                response = await client.get(url, params=mapped, headers=headers, timeout=timeout)
+            else:
+                response = await client.request(method, url, json=mapped, headers=headers, timeout=timeout)
+
+        response.raise_for_status()
+        try:
+            result = orjson.dumps(orjson.loads(response.content)).decode()
+        except orjson.JSONDecodeError:
+            result = response.text
+
+        if cacheable:
+            with _GET_CACHE_LOCK:
+                _GET_CACHE[cache_key] = result
+        else:
+            bust_cache()
+        return result
+
+    return run
+
+@functools.lru_cache(maxsize=None)
+def _resolve_python_target(target: str):
+    """Import and cache the callable behind a 'pkg.mod:fn' / 'pkg.mod.fn' target"""
+    import importlib
+    if ":" in target:
+        module_name, _, func_name = target.partition(":")
+    else:
+        module_name, _, func_name = target.rpartition(".")
+    func = getattr(importlib.import_module(module_name), func_name)
+    if not callable(func):
+        raise TypeError(f"tool target is not callable: {target}")
+    return func
+
+def make_python_executor(spec: Dict):
+    """Build the callable for a python-target tool spec
+
+    The target resolves once at build time, so a bad path fails when the
+    tool is constructed rather than on its first call, and hot-reloads
+    reuse the cached import.
+    """
+    func = _resolve_python_target(spec.get("execution", {}).get("target", ""))
+
+    def run(**params) -> str:
+        result = func(**params)
+        return result if isinstance(result, str) else orjson.dumps(result).decode()
+
+    return run
+
+def build_tools_from_specs(specs: List[Dict], async_mode: bool = False) -> List[StructuredTool]:
+    """Turn raw tool specs into invocable langchain tools
+
+    With async_mode, HTTP tools get coroutine executors so callers can
+    asyncio.gather several tool calls in one supervisor step.
+    """
+    from langchain_core.tools import StructuredTool
+
+    tools = []
+    for spec in specs:
+        name = spec["name"]
+        schema = spec.get("parameters", {})
+        args_model = create_parameter_model(name, schema)
+
+        execution_type = spec.get("execution", {}).get("type", "http")
+        if execution_type == "python":
+            executor = make_python_executor(spec)
+        elif async_mode:
+            tools.append(StructuredTool.from_function(
+                coroutine=make_async_http_executor(spec),
+                name=name,
+                description=spec.get("description", ""),
+                args_schema=args_model,
+            ))
+            continue
+        else:
+            executor = make_http_executor(spec)
+
+        tools.append(StructuredTool.from_function(
+            func=executor,
+            name=name,
+            description=spec.get("description", ""),
+            args_schema=args_model,
+        ))
+    return tools
+
+@functools.lru_cache(maxsize=8)
+def _load_specs_cached(filepath: str) -> tuple:
+    """Read and parse a tools file once per path
+
+    Returns a tuple so the lru_cache entry is never mutated in place;
+    callers get a fresh list per call.
+    """
+    with open(filepath, 'rb') as f:
+        return tuple(orjson.loads(f.read()))
+
+def load_tool_specs(filepath: str) -> List[Dict[str, Any]]:
+    """Load tool configurations as raw dictionaries for API execution
+
+    Cached per path - the agents re-load their tools.json on every
+    request, and the file only changes on deploy.
+    """
     try:
-        with open(filepath, 'r') as f:
-            return json.load(f)
+        return list(_load_specs_cached(filepath))
     except FileNotFoundError:
-        print(f"❌ Tools file not found: {filepath}")
+        logger.error("❌ Tools file not found: %s", filepath)
         return []
-    except json.JSONDecodeError as e:
-        print(f"❌ Invalid JSON in tools file: {e}")
+    except orjson.JSONDecodeError as e:
+        logger.error("❌ Invalid JSON in tools file: %s", e)
         return []
     except Exception as e:
-        print(f"❌ Error loading tools: {e}")
+        logger.error("❌ Error loading tools: %s", e)
         return []
+
+def load_tools_from_json(filepath: str) -> List[StructuredTool]:
+    """Load a tools file and build invocable tools with validated params"""
+    return build_tools_from_specs(load_tool_specs(filepath))
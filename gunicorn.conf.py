@@ -1,6 +1,12 @@
 # Add settings one by one to identify what breaks logging
 bind = "0.0.0.0:8000"
 workers = 1
+# Threaded workers: the sync worker blocked for the whole request, so
+# concurrency == worker count. With gthread one worker multiplexes
+# concurrent /query submissions and /status polls while LLM work runs
+# on the app's background executor.
+worker_class = "gthread"
+threads = 8
 timeout = 180
 worker_tmp_dir = "/tmp"
 
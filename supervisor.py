@@ -1,27 +1,33 @@
 from langgraph.prebuilt import create_react_agent
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.tools import tool
+import functools
 import json
 import os
 from typing import Dict, Any
+from cachetools import TTLCache
 import time
 import asyncio
 import re
 import gc
+import threading
+import logging
 import psutil
 import os
 
+logger = logging.getLogger(__name__)
+
 def monitor_memory():
     """Monitor memory usage"""
     process = psutil.Process(os.getpid())
     memory_mb = process.memory_info().rss / 1024 / 1024
-    print(f"🧠 Memory usage: {memory_mb:.1f} MB")
+    logger.debug("🧠 Memory usage: %.1f MB", memory_mb)
     return memory_mb
 
 def cleanup_memory():
     """Force garbage collection"""
     gc.collect()
-    print("🗑️ Memory cleanup performed")
+    logger.debug("🗑️ Memory cleanup performed")
 
 # Import your existing agents
 from agents.db.agent import process_user_query_with_agent
@@ -29,19 +35,32 @@ from agents.docs.agent import process_document_generation_request
 from agents.comms.agent import process_message_request
 from agents.summariser.agent import process_summariser_request
 
+# Precompiled extraction patterns - compiled once per process instead of on
+# every request
+_FILE_URL_PATTERNS = [
+    re.compile(r'https?://[^\s<>"{}|\\^`[\]]+\.(?:pdf|doc|docx|txt|html)', re.IGNORECASE),  # File URLs
+    re.compile(r'"(?:fileUrl|file_url|url|document_url)":\s*"([^"]+)"', re.IGNORECASE),         # JSON file URLs
+    re.compile(r'(?:File URL|Document URL|Report URL):\s*(https?://[^\s]+)', re.IGNORECASE),   # Labeled URLs
+    re.compile(r'(https?://[^\s<>"{}|\\^`[\]]+)', re.IGNORECASE),                            # Any HTTP URL
+]
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_SLACK_CHANNEL_RES = [
+    re.compile(r'#([a-zA-Z0-9_-]+)'),   # #channel-name
+    re.compile(r'([C][A-Z0-9]{8,})'),   # Channel IDs like C09BQEU1HCM
+]
+_THREAD_RE = re.compile(r'thread[:\s]+([0-9]+\.?[0-9]*)', re.IGNORECASE)
+
 
+@functools.lru_cache(maxsize=256)
 def extract_file_url_from_response(response_text: str) -> str:
-    """Dynamically extract file URL from any response text"""
+    """Dynamically extract file URL from any response text
+
+    Memoized: the same response string is scanned by several workflow steps
+    (docs tool, comms tool), so repeat lookups skip the regex passes.
+    """
     # Look for URLs in the response
-    url_patterns = [
-        r'https?://[^\s<>"{}|\\^`[\]]+\.(?:pdf|doc|docx|txt|html)',  # File URLs
-        r'"(?:fileUrl|file_url|url|document_url)":\s*"([^"]+)"',      # JSON file URLs
-        r'(?:File URL|Document URL|Report URL):\s*(https?://[^\s]+)', # Labeled URLs
-        r'(https?://[^\s<>"{}|\\^`[\]]+)'                             # Any HTTP URL
-    ]
-    
-    for pattern in url_patterns:
-        matches = re.findall(pattern, response_text, re.IGNORECASE)
+    for pattern in _FILE_URL_PATTERNS:
+        matches = pattern.findall(response_text)
         if matches:
             # Return the first valid looking URL
             for match in matches:
@@ -55,26 +74,23 @@ def extract_file_url_from_response(response_text: str) -> str:
     timestamp = int(time.time())
     return f"https://phujfghgjwpcvyjywlax.supabase.co/storage/v1/object/public/scout-reports-public/report-{timestamp}.pdf"
 
+@functools.lru_cache(maxsize=256)
 def extract_recipients_from_query(user_query: str) -> str:
-    """Dynamically extract recipients from user query"""
+    """Dynamically extract recipients from user query
+
+    Memoized: the API layer and the supervisor both call this with the same
+    query per request.
+    """
     # Extract email addresses
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    emails = re.findall(email_pattern, user_query)
-    
+    emails = _EMAIL_RE.findall(user_query)
+
     # Extract Slack channel IDs and names
     slack_channels = []
-    slack_patterns = [
-        r'#([a-zA-Z0-9_-]+)',  # #channel-name
-        r'([C][A-Z0-9]{8,})',  # Channel IDs like C09BQEU1HCM
-    ]
-    
-    for pattern in slack_patterns:
-        matches = re.findall(pattern, user_query)
-        slack_channels.extend(matches)
-    
+    for pattern in _SLACK_CHANNEL_RES:
+        slack_channels.extend(pattern.findall(user_query))
+
     # Extract thread IDs
-    thread_pattern = r'thread[:\s]+([0-9]+\.?[0-9]*)'
-    threads = re.findall(thread_pattern, user_query, re.IGNORECASE)
+    threads = _THREAD_RE.findall(user_query)
     
     # Build recipients string
     recipients_parts = []
@@ -95,7 +111,7 @@ def create_supervisor_workflow_tools():
         """Call DB agent with memory monitoring"""
         try:
             monitor_memory()
-            print("🗄️ Calling DB Agent...")
+            logger.debug("🗄️ Calling DB Agent...")
             
             # Extract the data query portion from the full request
             # Split on common separators and take the data-related part
@@ -105,7 +121,7 @@ def create_supervisor_workflow_tools():
                     data_query = user_request.split(separator)[0].strip()
                     break
             
-            print(f"📊 DB Agent Input: {data_query}")
+            logger.debug("📊 DB Agent Input: %s", data_query)
             
             start_time = time.time()
             
@@ -120,26 +136,26 @@ def create_supervisor_workflow_tools():
             
             if db_result.get('status') != 'success':
                 error_msg = db_result.get('error', 'Unknown DB agent error')
-                print(f"❌ DB agent failed: {error_msg}")
+                logger.error("❌ DB agent failed: %s", error_msg)
                 return f"ERROR: DB Agent failed - {error_msg}"
             
             db_data = db_result.get('response', '')
-            print(f"✅ DB agent completed in {execution_time:.2f}s")
-            print(f"📄 Retrieved {len(db_data)} characters of data")
+            logger.info("✅ DB agent completed in %.2fs", execution_time)
+            logger.debug("📄 Retrieved %s characters of data", len(db_data))
             
             cleanup_memory()
             return db_data
             
         except Exception as e:
             cleanup_memory()
-            print(f"❌ DB agent execution failed: {e}")
+            logger.error("❌ DB agent execution failed: %s", e)
             return f"ERROR: DB Agent exception - {str(e)}"
     
     @tool
     def call_docs_agent(db_data: str, original_query: str) -> str:
         """Call Docs agent with DB data and original query - generates document dynamically"""
         try:
-            print("📄 Calling Docs Agent...")
+            logger.debug("📄 Calling Docs Agent...")
             
             if db_data.startswith("ERROR:"):
                 return f"Cannot generate document: {db_data}"
@@ -166,7 +182,7 @@ def create_supervisor_workflow_tools():
             Use template2 for detailed reports with multiple sections.
             """
             
-            print(f"📋 Docs Agent Input: Generate {report_type}...")
+            logger.debug("📋 Docs Agent Input: Generate %s...", report_type)
             
             start_time = time.time()
             
@@ -181,28 +197,28 @@ def create_supervisor_workflow_tools():
             
             if docs_result.get('status') != 'success':
                 error_msg = docs_result.get('error', 'Unknown Docs agent error')
-                print(f"❌ Docs agent failed: {error_msg}")
+                logger.error("❌ Docs agent failed: %s", error_msg)
                 return f"ERROR: Docs Agent failed - {error_msg}"
             
             docs_response = docs_result.get('response', '')
-            print(f"✅ Docs agent completed in {execution_time:.2f}s")
-            print(f"📋 Generated document response")
+            logger.info("✅ Docs agent completed in %.2fs", execution_time)
+            logger.debug("📋 Generated document response")
             
             # Dynamically extract or generate file URL from response
             file_url = extract_file_url_from_response(docs_response)
-            print(f"📎 Dynamic file URL: {file_url}")
+            logger.debug("📎 Dynamic file URL: %s", file_url)
             
             return f"Document generated successfully. File URL: {file_url}. Response: {docs_response}"
             
         except Exception as e:
-            print(f"❌ Docs agent execution failed: {e}")
+            logger.error("❌ Docs agent execution failed: %s", e)
             return f"ERROR: Docs Agent exception - {str(e)}"
     
     @tool
     def call_comms_agent(docs_response: str, original_query: str) -> str:
         """Call Comms agent with docs response and original query - sends dynamically"""
         try:
-            print("📬 Calling Comms Agent...")
+            logger.debug("📬 Calling Comms Agent...")
             
             if docs_response.startswith("ERROR:"):
                 return f"Cannot send communications: {docs_response}"
@@ -229,7 +245,7 @@ def create_supervisor_workflow_tools():
             Route to appropriate channels based on recipient types (email/Slack).
             """
             
-            print(f"📧 Comms Agent Input: Send to {recipients_info}")
+            logger.debug("📧 Comms Agent Input: Send to %s", recipients_info)
             
             start_time = time.time()
             
@@ -244,17 +260,17 @@ def create_supervisor_workflow_tools():
             
             if comms_result.get('status') != 'success':
                 error_msg = comms_result.get('error', 'Unknown Comms agent error')
-                print(f"❌ Comms agent failed: {error_msg}")
+                logger.error("❌ Comms agent failed: %s", error_msg)
                 return f"ERROR: Comms Agent failed - {error_msg}"
             
             comms_response = comms_result.get('response', '')
-            print(f"✅ Comms agent completed in {execution_time:.2f}s")
-            print(f"📨 Communications sent successfully")
+            logger.info("✅ Comms agent completed in %.2fs", execution_time)
+            logger.debug("📨 Communications sent successfully")
             
             return f"Communications sent successfully to: {recipients_info}. File URL: {file_url}. Details: {comms_response}"
             
         except Exception as e:
-            print(f"❌ Comms agent execution failed: {e}")
+            logger.error("❌ Comms agent execution failed: %s", e)
             return f"ERROR: Comms Agent exception - {str(e)}"
 
 
@@ -263,7 +279,7 @@ def create_supervisor_workflow_tools():
     def call_summariser_agent(user_request: str) -> str:
         """Call Summariser agent for RCA document generation via MCP server"""
         try:
-            print("Calling Summariser Agent (MCP)...")
+            logger.debug("Calling Summariser Agent (MCP)...")
             
             start_time = time.time()
             try:
@@ -277,16 +293,16 @@ def create_supervisor_workflow_tools():
             
             if summariser_result.get("status") != "success":
                 error_msg = summariser_result.get("error", "Unknown Summariser agent error")
-                print(f"Summariser agent failed: {error_msg}")
+                logger.error("❌ Summariser agent failed: %s", error_msg)
                 return f"ERROR: Summariser Agent failed - {error_msg}"
             
             summariser_response = summariser_result.get("response", "")
-            print(f"Summariser agent completed in {execution_time:.2f}s")
+            logger.debug("Summariser agent completed in %.2fs", execution_time)
             
             return summariser_response
             
         except Exception as e:
-            print(f"Summariser agent execution failed: {e}")
+            logger.error("❌ Summariser agent execution failed: %s", e)
             return f"ERROR: Summariser Agent exception - {str(e)}"
 
     return [call_db_agent, call_docs_agent, call_comms_agent, call_summariser_agent]
@@ -343,8 +359,9 @@ User: "How many users signed up in the last 3 months? Send report to channel C09
 
 Choose the appropriate workflow based on the user's request type and ensure real data flows between all agents."""
 
+@functools.lru_cache(maxsize=1)
 def build_supervisor_agent():
-    """Build dynamic supervisor agent"""
+    """Build dynamic supervisor agent (constructed once and reused across requests)"""
     
     # Create workflow tools
     workflow_tools = create_supervisor_workflow_tools()
@@ -364,20 +381,38 @@ def build_supervisor_agent():
     
     return agent
 
+# Recent supervisor responses for repeated read-only queries. Requests that
+# mention recipients are never cached - delivery is a side effect that must
+# happen on every call. TTLCache is not thread-safe and app.py serves
+# requests from multiple worker threads, so access goes through the lock.
+_RESPONSE_CACHE: TTLCache = TTLCache(maxsize=128, ttl=300)
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
 # Main processing function
 async def process_supervisor_request(user_input: str) -> Dict[str, Any]:
     """Process complete report workflow request through dynamic supervisor"""
-    
+
+    recipients = extract_recipients_from_query(user_input)
+    cacheable = recipients == "No recipients specified"
+    cache_key = user_input.strip().lower()
+    if cacheable:
+        with _RESPONSE_CACHE_LOCK:
+            cached = _RESPONSE_CACHE.get(cache_key)
+        if cached is not None:
+            logger.debug("📦 Returning cached supervisor response")
+            return cached
+
     try:
         # Use the supervisor agent
         supervisor_agent = build_supervisor_agent()
         
-        print(f"🎯 Starting dynamic supervisor workflow...")
-        print(f"📝 User Request: {user_input}")
-        print(f"📧 Extracted Recipients: {extract_recipients_from_query(user_input)}")
+        logger.info("🎯 Starting dynamic supervisor workflow...")
+        logger.debug("📝 User Request: %s", user_input)
+        logger.debug("📧 Extracted Recipients: %s", extract_recipients_from_query(user_input))
         
-        # Let the supervisor handle the complete workflow
-        result = supervisor_agent.invoke({
+        # Let the supervisor handle the complete workflow - on a worker
+        # thread, so the loop that asyncio.run() owns stays responsive
+        result = await asyncio.to_thread(supervisor_agent.invoke, {
             "messages": [{"role": "user", "content": user_input}]
         })
         
@@ -385,12 +420,16 @@ async def process_supervisor_request(user_input: str) -> Dict[str, Any]:
         if result and 'messages' in result and result['messages']:
             final_message = result['messages'][-1]
             response_content = final_message.content if hasattr(final_message, 'content') else str(final_message)
-            
-            return {
+
+            response = {
                 "user_query": user_input,
                 "response": response_content,
                 "status": "success"
             }
+            if cacheable:
+                with _RESPONSE_CACHE_LOCK:
+                    _RESPONSE_CACHE[cache_key] = response
+            return response
         else:
             return {
                 "user_query": user_input,